@@ -1,2 +1,13 @@
-# Recursively find .hpp files and format them with clang-format
-Get-ChildItem -Recurse -Include *.hpp, *.cpp | ForEach-Object { clang-format -i $_.FullName }
+# Recursively find .hpp and .cpp files and format them with clang-format
+# Excluded directories (.git, CMake generated files) are matched with a single regex
+# The files are passed to clang-format in batches instead of one process per file
+$ExcludeRegex = '\\(\.git|CMakeFiles)\\'
+$BatchSize = 16
+$Files = @(Get-ChildItem -Recurse -Include *.hpp, *.cpp |
+    Where-Object { $_.FullName -notmatch $ExcludeRegex } |
+    ForEach-Object { $_.FullName })
+
+for ($i = 0; $i -lt $Files.Count; $i += $BatchSize) {
+    $Batch = $Files[$i..([Math]::Min($i + $BatchSize, $Files.Count) - 1)]
+    clang-format -i @Batch
+}